@@ -15,11 +15,12 @@ class OAuth2SessionLyric(config_entry_oauth2_flow.OAuth2Session):
 
     async def force_refresh_token(self) -> None:
         """Force a token refresh."""
-        new_token = await self.implementation.async_refresh_token(self.token)
+        async with self._token_lock:
+            new_token = await self.implementation.async_refresh_token(self.token)
 
-        self.hass.config_entries.async_update_entry(
-            self.config_entry, data={**self.config_entry.data, "token": new_token}
-        )
+            self.hass.config_entries.async_update_entry(
+                self.config_entry, data={**self.config_entry.data, "token": new_token}
+            )
 
 
 class ConfigEntryLyricClient(LyricClient):
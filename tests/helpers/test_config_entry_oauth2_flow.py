@@ -1,5 +1,6 @@
 """Tests for the Somfy config flow."""
 
+import asyncio
 from http import HTTPStatus
 import logging
 import time
@@ -15,7 +16,7 @@ from homeassistant.helpers import config_entry_oauth2_flow
 from homeassistant.helpers.network import NoURLAvailableError
 
 from tests.common import MockConfigEntry, mock_platform
-from tests.test_util.aiohttp import AiohttpClientMocker
+from tests.test_util.aiohttp import AiohttpClientMocker, AiohttpClientMockResponse
 from tests.typing import ClientSessionGenerator
 
 TEST_DOMAIN = "oauth2_test"
@@ -732,6 +733,65 @@ async def test_oauth_session(
     assert round(config_entry.data["token"]["expires_at"] - now) == 100
 
 
+async def test_oauth_session_concurrent_refresh(
+    hass: HomeAssistant, flow_handler, local_impl, aioclient_mock: AiohttpClientMocker
+) -> None:
+    """Test concurrent requests only refresh the token once."""
+    flow_handler.async_register_implementation(hass, local_impl)
+
+    release_refresh = asyncio.Event()
+
+    async def token_response(method, url, data):
+        """Hold the token refresh until both requests are waiting on it."""
+        await release_refresh.wait()
+        return AiohttpClientMockResponse(
+            method=method,
+            url=url,
+            json={"access_token": ACCESS_TOKEN_2, "expires_in": 100},
+        )
+
+    aioclient_mock.post(TOKEN_URL, side_effect=token_response)
+    aioclient_mock.post("https://example.com", status=201)
+
+    config_entry = MockConfigEntry(
+        domain=TEST_DOMAIN,
+        data={
+            "auth_implementation": TEST_DOMAIN,
+            "token": {
+                "refresh_token": REFRESH_TOKEN,
+                "access_token": ACCESS_TOKEN_1,
+                "expires_in": 10,
+                "expires_at": 0,  # Forces a refresh,
+                "token_type": "bearer",
+            },
+        },
+    )
+    config_entry.add_to_hass(hass)
+
+    session = config_entry_oauth2_flow.OAuth2Session(hass, config_entry, local_impl)
+    tasks = [
+        hass.async_create_task(session.async_request("post", "https://example.com"))
+        for _ in range(2)
+    ]
+    # Let both requests reach the token check while the refresh is in flight
+    await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    release_refresh.set()
+    responses = await asyncio.gather(*tasks)
+    assert all(resp.status == 201 for resp in responses)
+
+    # One token refresh, two requests
+    token_calls = [
+        call for call in aioclient_mock.mock_calls if str(call[1]) == TOKEN_URL
+    ]
+    assert len(token_calls) == 1
+    assert len(aioclient_mock.mock_calls) == 3
+    for call in aioclient_mock.mock_calls[1:]:
+        assert call[3]["authorization"] == f"Bearer {ACCESS_TOKEN_2}"
+
+    assert config_entry.data["token"]["access_token"] == ACCESS_TOKEN_2
+
+
 async def test_oauth_session_with_clock_slightly_out_of_sync(
     hass: HomeAssistant, flow_handler, local_impl, aioclient_mock: AiohttpClientMocker
 ) -> None: